@@ -10,9 +10,21 @@ SUMMARIES_FOLDER = "Summaries"
 LOGS_FOLDER = "logs"
 AUTH_FOLDER = "auth"
 
+# --- Logging Configuration ---
+# Route every module logger through a single background queue listener
+LOG_QUEUE_ENABLED = True
+# Maximum number of records written to a log file in a single write
+LOG_BATCH_SIZE = 50
+# Write log files as JSON lines instead of plain text
+LOG_JSON = False
+# Keep 1 of every N per-item records for each stage (logger name), e.g. {"upload": 10}
+LOG_SAMPLE_RATES = {}
+
 # --- File Paths ---
 STUDENTS_CSV_FILE = "data/students.csv"
 NON_CLASS_DATES_FILE = "data/non_class_dates.txt"
+# Last downloaded sheet data, reused while the spreadsheet is unchanged
+SHEET_SNAPSHOT_FILE = "data/sheet_snapshot.json"
 CREDENTIALS_FILE = os.path.join(AUTH_FOLDER, "credentials.json")
 # Separated token files for each service
 SHEETS_TOKEN_FILE = os.path.join(AUTH_FOLDER, "gsheets/token.json")
@@ -26,7 +38,9 @@ FONT_BOLD = "Roboto/static/Roboto-Bold.ttf"
 # --- Google Sheets API Configuration ---
 SHEETS_SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
 SPREADSHEET_ID = '1vAMoSKzAEh3r0WQxlwYnU1nu1l0VsPQKsCw_Co2GROE'
-SHEET_RANGE = 'schedule!A:D'
+# All ranges are fetched in one batchGet; ranges whose header row differs from
+# the first range's are skipped
+SHEET_RANGES = ['schedule!A:D']
 
 # --- Google Drive API Configuration ---
 DRIVE_SCOPES = ['https://www.googleapis.com/auth/drive']
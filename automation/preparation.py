@@ -1,17 +1,112 @@
 import os
 import csv
+import json
 from googleapiclient.discovery import build
 from .utils import create_logging, authenticate
 from . import config
-from typing import List
+from typing import List, Optional
 
 # Initialize logging
 logger = create_logging("preparation", "preparation.log")
 
 
+def get_sheet_revision() -> str:
+    """
+    Retrieves the current version of the spreadsheet from Google Drive.
+
+    Returns:
+        str: The spreadsheet's version number, or an empty string if it could
+             not be retrieved.
+    """
+    try:
+        creds = authenticate(
+            token_file=config.DRIVE_TOKEN_FILE,
+            credentials_file=config.CREDENTIALS_FILE,
+            scopes=config.DRIVE_SCOPES,
+            logger=logger,
+        )
+
+        service = build("drive", "v3", credentials=creds)
+        metadata = (
+            service.files()
+            .get(fileId=config.SPREADSHEET_ID, fields="version,modifiedTime")
+            .execute()
+        )
+        logger.info(
+            f"Spreadsheet version {metadata.get('version')} "
+            f"(modified {metadata.get('modifiedTime')})"
+        )
+        return str(metadata.get("version", ""))
+
+    except Exception as e:
+        logger.warning(f"Could not retrieve spreadsheet version: {str(e)}")
+        return ""
+
+
+def load_snapshot(revision: str) -> Optional[List[list]]:
+    """
+    Loads the last downloaded sheet data if it matches the given revision.
+
+    Parameters:
+        revision (str): The current version of the spreadsheet.
+
+    Returns:
+        Optional[List[list]]: The cached data, or None if there is no usable
+                              snapshot.
+    """
+    if not revision or not os.path.exists(config.SHEET_SNAPSHOT_FILE):
+        return None
+    try:
+        with open(config.SHEET_SNAPSHOT_FILE, "r") as snapshot_file:
+            snapshot = json.load(snapshot_file)
+    except (IOError, ValueError) as e:
+        logger.warning(f"Could not read sheet snapshot: {str(e)}")
+        return None
+
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("spreadsheet_id") != config.SPREADSHEET_ID
+        or snapshot.get("revision") != revision
+        or snapshot.get("ranges") != config.SHEET_RANGES
+    ):
+        return None
+    return snapshot.get("values") or None
+
+
+def save_snapshot(revision: str, values: List[list]):
+    """
+    Saves the downloaded sheet data together with its spreadsheet and revision.
+    Failures are only logged, since the snapshot is just a cache.
+
+    Parameters:
+        revision (str): The version of the spreadsheet the data belongs to.
+        values (List[list]): The downloaded sheet data.
+    """
+    if not revision or not values:
+        return
+    try:
+        os.makedirs(os.path.dirname(config.SHEET_SNAPSHOT_FILE), exist_ok=True)
+        with open(config.SHEET_SNAPSHOT_FILE, "w") as snapshot_file:
+            json.dump(
+                {
+                    "spreadsheet_id": config.SPREADSHEET_ID,
+                    "revision": revision,
+                    "ranges": config.SHEET_RANGES,
+                    "values": values,
+                },
+                snapshot_file,
+            )
+    except OSError as e:
+        logger.warning(f"Could not write sheet snapshot: {str(e)}")
+
+
 def download_sheet_data() -> List[list]:
     """
-    Downloads columns A-D from Google Sheet.
+    Downloads all configured ranges from Google Sheet in a single batchGet.
+    Numbers are returned unformatted, and the header row of every range after
+    the first one is dropped; ranges whose header differs from the first one
+    are skipped. The download is skipped when the spreadsheet has
+    not changed since the last snapshot.
 
     Returns:
         List[list]: The raw data from the Google Sheet, or an empty list if
@@ -20,6 +115,12 @@ def download_sheet_data() -> List[list]:
     try:
         logger.info("Starting Google Sheets data download")
 
+        revision = get_sheet_revision()
+        snapshot = load_snapshot(revision)
+        if snapshot is not None:
+            logger.info(f"Spreadsheet unchanged, reusing snapshot of {revision}")
+            return snapshot
+
         creds = authenticate(
             token_file=config.SHEETS_TOKEN_FILE,
             credentials_file=config.CREDENTIALS_FILE,
@@ -30,18 +131,36 @@ def download_sheet_data() -> List[list]:
         service = build("sheets", "v4", credentials=creds)
         logger.debug("Sheets API service initialized")
 
-        logger.info(f"Downloading range {config.SHEET_RANGE} from spreadsheet")
+        logger.info(f"Downloading ranges {config.SHEET_RANGES} from spreadsheet")
         result = (
             service.spreadsheets()
             .values()
-            .get(spreadsheetId=config.SPREADSHEET_ID, range=config.SHEET_RANGE)
+            .batchGet(
+                spreadsheetId=config.SPREADSHEET_ID,
+                ranges=config.SHEET_RANGES,
+                valueRenderOption="UNFORMATTED_VALUE",
+                dateTimeRenderOption="FORMATTED_STRING",
+            )
             .execute()
         )
 
-        values = result.get("values", [])
+        values = []
+        for value_range in result.get("valueRanges", []):
+            rows = value_range.get("values", [])
+            if not values:
+                values.extend(rows)
+            elif rows and rows[0] == values[0]:
+                values.extend(rows[1:])
+            elif rows:
+                logger.warning(
+                    f"Skipping range {value_range.get('range')}: header "
+                    f"{rows[0]} does not match {values[0]}"
+                )
+
         if not values:
-            logger.warning("No data found in specified range")
+            logger.warning("No data found in specified ranges")
 
+        save_snapshot(revision, values)
         return values
 
     except Exception as e:
@@ -3,6 +3,7 @@ import requests
 import datetime
 import calendar
 import locale
+import math
 import os
 from . import config
 from typing import Set, List
@@ -112,6 +113,33 @@ def generate_class_dates(
     return valid_dates
 
 
+def parse_number_list(value, student_name: str) -> List[float]:
+    """
+    Parses a cell that holds either a single number or comma-separated numbers.
+
+    Parameters:
+    - value: A number (unformatted sheet value) or a string such as "1,1.5".
+    - student_name (str): The student the cell belongs to, used in errors.
+
+    Returns:
+    - List[float]: The parsed numbers.
+
+    Raises:
+    - ValueError: If the cell is empty or holds a value that is not a number.
+    """
+    try:
+        if isinstance(value, str):
+            numbers = [float(v) for v in value.split(",")]
+        else:
+            numbers = [float(value)]
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid value '{value}' for student: {student_name}")
+
+    if any(math.isnan(n) for n in numbers):
+        raise ValueError(f"Missing value for student: {student_name}")
+    return numbers
+
+
 def process_data(
     month: int, year: int, students_csv_path: str, manual_dates_filepath: str
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
@@ -142,7 +170,7 @@ def process_data(
     for _, row in students_df.iterrows():
         student_name = row["Student Name"]
         days = [d.strip() for d in row["Days Of Week"].split(",")]
-        hours_per_day = list(map(float, row["Hours per Day"].split(",")))
+        hours_per_day = parse_number_list(row["Hours per Day"], student_name)
         price_per_hour = float(row["Price per hour"])
 
         for day, hours in zip(days, hours_per_day):
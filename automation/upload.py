@@ -20,13 +20,15 @@ def get_or_create_folder_id(drive_service, folder_name: str) -> str:
     Returns:
     - str: The ID of the existing or newly created folder.
     """
-    logger.info(f"Checking for existing folder '{folder_name}'...")
+    logger.info(
+        f"Checking for existing folder '{folder_name}'...", extra={"per_item": True}
+    )
     query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
     response = drive_service.files().list(q=query, spaces="drive").execute()
 
     if response["files"]:
         folder_id = response["files"][0]["id"]
-        logger.info(f"Folder found. ID: {folder_id}")
+        logger.info(f"Folder found. ID: {folder_id}", extra={"per_item": True})
         return folder_id
     else:
         logger.info(f"Folder not found. Creating a new one...")
@@ -83,11 +85,16 @@ def upload_invoices(prefix: str):
                     file_metadata = {"name": filename, "parents": [subfolder_id]}
                     media = MediaFileUpload(file_path, mimetype="image/png")
 
-                    logger.info(f"Uploading file: {filename}")
+                    logger.info(
+                        f"Uploading file: {filename}", extra={"per_item": True}
+                    )
                     service.files().create(
                         body=file_metadata, media_body=media, fields="id"
                     ).execute()
-                    logger.info(f"Successfully uploaded {filename}")
+                    logger.info(
+                        f"Successfully uploaded {filename}",
+                        extra={"per_item": True},
+                    )
 
     except Exception as e:
         logger.error(f"Unexpected error during upload: {e}", exc_info=True)
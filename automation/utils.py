@@ -1,12 +1,295 @@
 # Configure logging
+import atexit
+import copy
 import datetime as dt
+import json
 import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from . import config
 
+FILE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+CONSOLE_FORMAT = "%(levelname)s - %(message)s"
+
+# Shared state for queue-based logging
+_log_queue = None
+_worker_queues = {}
+_listeners = []
+_configured_loggers = {}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects"""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "name": record.name,
+            "level": record.levelname,
+            "process": record.process,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only 1 of every `every` records flagged with `per_item=True`.
+    Each call site is counted separately, so paired messages such as
+    "Uploading file" / "Successfully uploaded" are sampled alike.
+    """
+
+    def __init__(self, every):
+        super().__init__()
+        self.every = every
+        self._seen = {}
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or not getattr(record, "per_item", False):
+            return True
+        call_site = (record.pathname, record.lineno)
+        seen = self._seen.get(call_site, 0)
+        self._seen[call_site] = seen + 1
+        return seen % self.every == 0
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps the exception text apart from the message"""
+
+    exc_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.exc_formatter.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+class _LogFileFilter(logging.Filter):
+    """Tag records with their destination log file before they are queued"""
+
+    def __init__(self, log_file):
+        super().__init__()
+        self.log_file = log_file
+
+    def filter(self, record):
+        record.log_file = self.log_file
+        return True
+
+
+class _BatchingFileHandler(logging.FileHandler):
+    """
+    File handler that buffers formatted records and writes them with a single
+    write() and flush(). The buffer is written when it reaches `capacity`, on
+    WARNING or higher, and whenever the listener has drained its queue.
+    """
+
+    def __init__(self, filename, capacity):
+        super().__init__(filename)
+        self.capacity = capacity
+        self.buffer = []
+
+    def emit(self, record):
+        try:
+            self.buffer.append(self.format(record) + self.terminator)
+            if len(self.buffer) >= self.capacity or record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write("".join(self.buffer))
+                self.buffer = []
+            super().flush()
+        finally:
+            self.release()
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers once the queue is empty"""
+
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+class _RoutingHandler(logging.Handler):
+    """Dispatch queued records to the console and a batched per-file handler"""
+
+    def __init__(self):
+        super().__init__()
+        self.console_handler = logging.StreamHandler()
+        self.console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        self.file_handlers = {}
+
+    def _get_file_handler(self, log_file):
+        handler = self.file_handlers.get(log_file)
+        if handler is None:
+            handler = _build_file_handler(log_file, batch_size=config.LOG_BATCH_SIZE)
+            self.file_handlers[log_file] = handler
+        return handler
+
+    def emit(self, record):
+        log_file = getattr(record, "log_file", None)
+        if log_file:
+            self._get_file_handler(log_file).handle(record)
+        self.console_handler.handle(record)
+
+    def flush(self):
+        for handler in self.file_handlers.values():
+            handler.flush()
+        self.console_handler.flush()
+
+    def close(self):
+        for handler in self.file_handlers.values():
+            handler.close()
+        self.file_handlers = {}
+        self.console_handler.close()
+        super().close()
+
+
+def _build_file_handler(log_file, batch_size=None):
+    """Create the file handler for `log_file` using the configured format"""
+    path = f"{config.LOGS_FOLDER}/{log_file}"
+    if batch_size:
+        file_handler = _BatchingFileHandler(path, batch_size)
+    else:
+        file_handler = logging.FileHandler(path)
+    if config.LOG_JSON:
+        file_handler.setFormatter(JsonFormatter())
+    else:
+        file_handler.setFormatter(logging.Formatter(FILE_FORMAT))
+    return file_handler
+
+
+def _start_listener(log_queue, handler):
+    """Start a background listener draining `log_queue` into `handler`"""
+    listener = _BatchingQueueListener(log_queue, handler)
+    listener.start()
+    _listeners.append(listener)
+
+
+def _start_queue_logging():
+    """Create the in-process log queue and start its background listener"""
+    global _log_queue
+
+    _log_queue = queue.Queue(-1)
+    _start_listener(_log_queue, _RoutingHandler())
+    atexit.register(stop_queue_logging)
+
+
+def _use_sync_handlers():
+    """Detach every configured logger from the queue and log synchronously"""
+    global _log_queue
+
+    _log_queue = None
+    for name, log_file in _configured_loggers.items():
+        _attach_handlers(logging.getLogger(name), log_file, use_queue=False)
+
+
+def stop_queue_logging():
+    """
+    Stop the background listeners, flush all pending log records and switch
+    every configured logger back to synchronous handlers.
+    """
+    listeners = _listeners[:]
+    _listeners.clear()
+    for listener in reversed(listeners):
+        listener.stop()
+    for listener in listeners:
+        for handler in listener.handlers:
+            handler.close()
+    _worker_queues.clear()
+    if _log_queue is not None:
+        _use_sync_handlers()
+
+
+def get_log_queue(ctx=None):
+    """
+    Return the log queue to pass to process-pool workers.
+    The queue is created from `ctx`, which must be the same multiprocessing
+    context the pool is started with (e.g. its `mp_context`); it defaults to
+    the global context. Returns None when queue logging is not active.
+    """
+    if not _listeners:
+        return None
+    ctx = ctx or multiprocessing.get_context()
+    start_method = ctx.get_start_method()
+    if start_method not in _worker_queues:
+        worker_queue = ctx.Queue(-1)
+        _start_listener(worker_queue, _listeners[0].handlers[0])
+        _worker_queues[start_method] = worker_queue
+    return _worker_queues[start_method]
+
+
+def _attach_handlers(logger, log_file, use_queue):
+    """Attach either a queue handler or synchronous file/console handlers"""
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    if use_queue:
+        queue_handler = _QueueHandler(_log_queue)
+        queue_handler.addFilter(_LogFileFilter(log_file))
+        logger.addHandler(queue_handler)
+        return
+
+    file_handler = _build_file_handler(log_file)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+
+    logger.addHandler(file_handler)
+    logger.addHandler(console_handler)
+
+
+def _reset_after_fork():
+    """
+    Forked children inherit the queue handlers but not the listener thread,
+    so fall back to synchronous handlers until `init_worker_logging` runs.
+    """
+    if _log_queue is None:
+        return
+    _listeners.clear()
+    _worker_queues.clear()
+    _use_sync_handlers()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def init_worker_logging(log_queue):
+    """
+    Route a worker process's loggers through the parent's log queue.
+    Use as the `initializer` of a process pool, with `get_log_queue(ctx)` as
+    argument, where `ctx` is the multiprocessing context of that pool.
+    """
+    global _log_queue
+
+    if log_queue is None:
+        return
+    _log_queue = log_queue
+    for name, log_file in _configured_loggers.items():
+        _attach_handlers(logging.getLogger(name), log_file, use_queue=True)
+
 
 def create_logging(name, log_file, level=logging.INFO):
     """Configure a logger with file and console output"""
@@ -19,16 +302,19 @@ def create_logging(name, log_file, level=logging.INFO):
     if logger.handlers:
         return logger
 
-    file_handler = logging.FileHandler(f"{config.LOGS_FOLDER}/{log_file}")
-    file_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    )
+    sample_rate = config.LOG_SAMPLE_RATES.get(name, 1)
+    if sample_rate > 1:
+        logger.addFilter(SamplingFilter(sample_rate))
 
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+    # Worker processes only log through the queue once the parent hands it over
+    is_worker = multiprocessing.parent_process() is not None
+    if config.LOG_QUEUE_ENABLED and _log_queue is None and not is_worker:
+        _start_queue_logging()
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    _attach_handlers(
+        logger, log_file, use_queue=config.LOG_QUEUE_ENABLED and _log_queue is not None
+    )
+    _configured_loggers[name] = log_file
 
     return logger
 